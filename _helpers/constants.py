@@ -3,17 +3,20 @@
 '''
 Constants and configurations for the resume LLM application.
 
-PROTECTED_KEYS: List of keys in the resume JSON that should not be modified by the LLM.
+PROTECTED_KEYS: Set of keys in the resume JSON that should not be modified by the LLM.
 MODEL_NAME: The name of the LLM model to use for generating resume updates.
 STOPWORDS: Set of common words to filter out during keyword extraction.
+STOPWORD_EXCEPTIONS: Keywords kept even though scikit-learn lists them as stopwords.
 '''
 
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
 # ---- Constants/Keywords ----
 # These sections of the resume are protected and should not be modified by the LLM.
 # They will be merged back into the final resume after LLM processing.
 # This allows the LLM to focus on the sections that need updating while preserving important information.
 # Add any additional keys that should be protected from LLM modification.
-PROTECTED_KEYS = ["education", "certificates"]
+PROTECTED_KEYS = frozenset(["education", "certificates"])
 
 # Current model name used for LLM requests
 # This can be changed based on the available models or user preference.
@@ -21,10 +24,18 @@ PROTECTED_KEYS = ["education", "certificates"]
 # Example: "llama3:8b" for Llama 3 8B
 MODEL_NAME = "llama3:8b"  # Default model for LLM requests
 
+# Words in scikit-learn's English stopword list that are real resume and job keywords
+# (e.g. "go" the language, "system", "full" as in full-stack) and must not be filtered.
+STOPWORD_EXCEPTIONS = frozenset([
+    'back', 'bill', 'bottom', 'call', 'computer', 'describe', 'detail', 'fill', 'find',
+    'fire', 'front', 'full', 'go', 'interest', 'move', 'part', 'show', 'system', 'top'
+])
+
 # List of common stopwords to filter out from keyword extraction
-# This can be expanded based on specific needs
-# or language requirements.
-STOPWORDS = set([
+# This extends scikit-learn's English stopword list (minus STOPWORD_EXCEPTIONS)
+# and can be expanded based on specific needs or language requirements.
+# A frozenset keeps membership checks fast and the constant immutable.
+STOPWORDS = (frozenset(ENGLISH_STOP_WORDS) - STOPWORD_EXCEPTIONS) | frozenset([
     'the', 'and', 'for', 'with', 'you', 'are', 'this', 'that', 'from', 'they',
     'their', 'your', 'will', 'have', 'has', 'but', 'not', 'all', 'any', 'can',
     'may', 'such', 'a', 'an', 'of', 'in', 'on', 'at', 'by', 'to', 'is', 'it',
@@ -4,22 +4,88 @@
 import json
 import os
 import difflib
-import pypandoc
-from .styler import apply_styles_to_docx
+import itertools
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+# pypandoc and the python-docx styler are imported where they are used: with
+# pandoc on PATH pypandoc is never needed, and python-docx is only loaded once
+# a document is actually styled, keeping app start-up light.
+
+# orjson is optional; it parses and serializes faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _find_pandoc():
+    '''
+    Locate the pandoc executable, preferring PATH and then any copy pypandoc knows about
+    (e.g. one bundled by pypandoc_binary).
+    Returns the path, or None if pandoc is unavailable.
+    '''
+    path = shutil.which('pandoc')
+    if path:
+        return path
+    try:
+        import pypandoc
+        return pypandoc.get_pandoc_path()
+    except (ImportError, OSError):
+        return None
+
+# Resolved once so conversions can call pandoc directly,
+# skipping the format probes pypandoc runs on every call
+PANDOC_PATH = _find_pandoc()
+
+# Characters replaced when building file and folder names from user input;
+# path separators are included so names cannot create nested folders
+SAFE_NAME_TABLE = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+def safe_name_part(value, default='resume'):
+    '''
+    Turn user input into a single file or folder name component.
+    Separators become underscores and leading/trailing dots are stripped,
+    so values like '..' cannot point outside the output folder.
+    Returns default if nothing usable is left.
+    '''
+    return value.translate(SAFE_NAME_TABLE).strip('.') or default
 
 def load_json(filepath):
     '''
     Load JSON data from a file.
     Returns the parsed JSON object.
     '''
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     with open(filepath) as f:
         return json.load(f)
 
+def iter_strings(obj):
+    '''
+    Yield every string leaf in nested dicts and lists.
+    Dictionary keys are skipped.
+    '''
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from iter_strings(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from iter_strings(value)
+
 def save_file(path, content):
     '''
     Save content to a file.
     If the content is a dictionary, convert it to JSON.
     '''
+    if isinstance(content, dict):
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(content, option=orjson.OPT_INDENT_2))
+            return
+        content = json.dumps(content, indent=2)
     with open(path, 'w') as f:
         f.write(content)
 
@@ -30,6 +96,7 @@ def convert_to_pdf(md_path, folder, name):
     '''
     pdf_path = os.path.join(folder, f"{name}.pdf")
     try:
+        import pypandoc
         pypandoc.convert_file(md_path, 'pdf', outputfile=pdf_path)
         return pdf_path
     except Exception as e:
@@ -43,12 +110,54 @@ def convert_to_docx(md_path, folder, name):
     '''
     docx_path = os.path.join(folder, f"{name}.docx")
     try:
+        import pypandoc
         pypandoc.convert_file(md_path, 'docx', outputfile=docx_path)
         return docx_path
     except Exception as e:
         print(f"DOCX conversion failed: {e}")
         return None
 
+def _run_pandoc(md_path, out_path, md_text=None):
+    '''
+    Run pandoc on a Markdown file, inferring the output format from out_path.
+    If md_text is given it is piped to pandoc instead of re-reading md_path.
+    Returns out_path on success, None on failure.
+    '''
+    if md_text is None:
+        cmd, stdin = [PANDOC_PATH, md_path, '-o', out_path], None
+    else:
+        cmd, stdin = [PANDOC_PATH, '-f', 'markdown', '-o', out_path], md_text.encode('utf-8')
+    try:
+        subprocess.run(cmd, input=stdin, check=True, capture_output=True)
+        return out_path
+    except subprocess.CalledProcessError as e:
+        # Pandoc explains the failure (missing engine, bad markdown) on stderr
+        print(f"Conversion to {out_path} failed: {e}\n{e.stderr.decode(errors='replace')}")
+        return None
+    except OSError as e:
+        print(f"Conversion to {out_path} failed: {e}")
+        return None
+
+def convert_to_pdf_and_docx(md_path, folder, name, include_pdf=True, md_text=None):
+    '''
+    Convert Markdown file to PDF and DOCX, running both conversions in parallel.
+    Invokes the pandoc executable found at import time directly.
+    Pass the already-rendered md_text to feed pandoc from memory.
+    Returns a tuple of (pdf_path, docx_path); a path is None if that conversion failed or was skipped.
+    '''
+    if PANDOC_PATH is None:
+        print("Conversion skipped: pandoc was not found on PATH or through pypandoc.")
+        return None, None
+    pdf_args = (md_path, os.path.join(folder, f"{name}.pdf"), md_text)
+    docx_args = (md_path, os.path.join(folder, f"{name}.docx"), md_text)
+
+    # Each conversion waits on its own subprocess, so threads overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pdf_future = executor.submit(_run_pandoc, *pdf_args) if include_pdf else None
+        docx_future = executor.submit(_run_pandoc, *docx_args)
+        pdf_path = pdf_future.result() if pdf_future else None
+        return pdf_path, docx_future.result()
+
 def apply_docx_styles(docx_path, style_json, folder, name):
     '''
     Apply styles to DOCX file based on JSON configuration.
@@ -56,16 +165,26 @@ def apply_docx_styles(docx_path, style_json, folder, name):
     '''
     styled_path = os.path.join(folder, f"{name}_styled.docx")
     try:
+        from .styler import apply_styles_to_docx
         apply_styles_to_docx(docx_path, style_json, styled_path)
         return styled_path
     except Exception as e:
         print(f"Styling DOCX failed: {e}")
         return None
 
+# Maximum number of lines generate_diff returns
+MAX_DIFF_LINES = 200
+
 def generate_diff(old, new):
     '''
-    Generate a unified diff between two text strings.
-    Returns the diff as a string.
+    Generate a unified diff between two text strings, with one line of context.
+    Returns the diff as a string (empty if nothing changed), truncated to MAX_DIFF_LINES lines.
     '''
-    diff = '\n'.join(difflib.unified_diff(old.splitlines(), new.splitlines(), lineterm=''))
+    old_lines, new_lines = old.splitlines(), new.splitlines()
+    # Unchanged text needs no SequenceMatcher pass at all
+    if old_lines == new_lines:
+        return ''
+    diff_lines = difflib.unified_diff(old_lines, new_lines, lineterm='', n=1)
+    # Bound the output size; unified_diff still computes all opcodes up front
+    diff = '\n'.join(itertools.islice(diff_lines, MAX_DIFF_LINES))
     return diff
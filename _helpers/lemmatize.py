@@ -1,24 +1,36 @@
 # _helpers/lemmatize.py
 
-import nltk
-import os
+import functools
 import string
 from .constants import STOPWORDS
+from .nltk_setup import ensure_nltk_resources
 from nltk.corpus import wordnet
 from nltk.stem import WordNetLemmatizer
 from nltk.tokenize import word_tokenize
-from sklearn.feature_extraction.text import TfidfVectorizer
-from nltk.data import find
+from nltk.tag import PerceptronTagger
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+
+@functools.lru_cache(maxsize=1)
+def _get_tagger():
+    """
+    Load the perceptron tagger once and reuse it for every call.
+    Tagger data is downloaded up front by ensure_nltk_resources().
+    """
+    return PerceptronTagger()
 
 def patched_pos_tag(tokens):
-    try:
-        nltk.data.find('taggers/averaged_perceptron_tagger')
-    except LookupError:
-        nltk.download('averaged_perceptron_tagger')
-    return nltk.pos_tag(tokens)
+    return _get_tagger().tag(tokens)
 
 lemmatizer = WordNetLemmatizer()
 
+# Stateless term counter for the two-document keyword corpus; skips building a vocabulary.
+# Input is already lowercased, lemmatized and space-joined, so sklearn's own
+# preprocessing and regex tokenizer are bypassed.
+_HASHER = HashingVectorizer(
+    n_features=2**18, alternate_sign=False, norm=None,
+    tokenizer=str.split, preprocessor=None, lowercase=False, token_pattern=None
+)
+
 def get_wordnet_pos(tag):
     """
     Map NLTK POS tag to WordNet POS tag.
@@ -34,69 +46,109 @@ def get_wordnet_pos(tag):
     else:
         return wordnet.NOUN
 
+# Process-wide (token, WordNet POS) -> lemma cache shared by every document
+_LEMMA_CACHE = {}
+_LEMMA_CACHE_MAX_ENTRIES = 50_000
+
+def _lemma(token, pos):
+    key = (token, pos)
+    lemma = _LEMMA_CACHE.get(key)
+    if lemma is None:
+        if len(_LEMMA_CACHE) > _LEMMA_CACHE_MAX_ENTRIES:
+            _LEMMA_CACHE.clear()
+        lemma = lemmatizer.lemmatize(token, pos)
+        _LEMMA_CACHE[key] = lemma
+    return lemma
+
+# Texts larger than this are lemmatized without being kept in the cache
+_LEMMA_CACHE_MAX_CHARS = 100_000
+
 def lemmatize_text(text):
     """
     Lemmatize the input text using WordNetLemmatizer and patched POS tagging.
     Filters out stopwords and punctuation.
     Returns a list of clean lemmas (base words).
     """
+    if len(text) > _LEMMA_CACHE_MAX_CHARS:
+        return _lemmatize_uncached(text)
+    return list(_lemmatize_cached(text))
+
+@functools.lru_cache(maxsize=32)
+def _lemmatize_cached(text):
+    """
+    Memoized lemmatization, so repeat job descriptions and resumes skip
+    tagging entirely. Returns a tuple to keep cached results immutable.
+    """
+    return tuple(_lemmatize_uncached(text))
+
+def _lemmatize_uncached(text):
+    # Tokenizing, tagging and lemmatizing all need NLTK data; returns immediately
+    # once resources have been checked in this process
+    ensure_nltk_resources()
     tokens = word_tokenize(text.lower())
-    # Remove punctuation and stopwords
-    tokens = [t for t in tokens if t not in STOPWORDS and t not in string.punctuation]
-    
-    pos_tags = patched_pos_tag(tokens)
-    lemmas = [
-        lemmatizer.lemmatize(token, get_wordnet_pos(pos))
-        for token, pos in pos_tags
-        if token not in STOPWORDS and token not in string.punctuation
-    ]
-    return lemmas
+    # Remove punctuation, then drop stopwords by lemma so that e.g. "system"
+    # and "systems" are treated the same
+    tokens = [t for t in tokens if t not in string.punctuation]
+    lemmas = (_lemma(token, get_wordnet_pos(pos)) for token, pos in patched_pos_tag(tokens))
+    return [lemma for lemma in lemmas if lemma not in STOPWORDS]
 
+def lemmatize_texts(texts):
+    """
+    Lemmatize several texts, reusing cached results for texts seen before.
+    Returns a list of lemma lists, one per input text.
+    """
+    return [lemmatize_text(text) for text in texts]
+
+@functools.lru_cache(maxsize=None)
 def get_synonyms(word):
     """
     Get WordNet synonyms for a word.
+    Results are cached, so a frozenset is returned to keep them immutable.
     """
     synonyms = set()
     for syn in wordnet.synsets(word):
         for lemma in syn.lemmas():
             synonyms.add(lemma.name().lower().replace('_', ' '))
-    return synonyms
-
-def compute_tfidf_scores(texts):
-    """
-    Compute TF-IDF scores for a list of documents.
-    """
-    vectorizer = TfidfVectorizer()
-    X = vectorizer.fit_transform(texts)
-    feature_names = vectorizer.get_feature_names_out()
-    scores_list = []
-    for row in X:
-        scores = {feature_names[col]: row[0, col] for col in row.nonzero()[1]}
-        scores_list.append(scores)
-    return scores_list
+    return frozenset(synonyms)
 
 def match_keywords_with_synonyms(job_desc, resume_text):
     """
     Match keywords between job description and resume using lemmatization and synonyms.
+    The TF-IDF matrix is fit on the same lemmatized texts so ranking can reuse it.
+    Returns a tuple of (matched_keywords, tfidf_matrix).
     """
-    job_lems = set(lemmatize_text(job_desc))
-    resume_lems = set(lemmatize_text(resume_text))
-    expanded_job = job_lems.copy()
-    for word in job_lems:
+    job_lems, resume_lems = lemmatize_texts([job_desc, resume_text])
+    job_str, resume_str = ' '.join(job_lems), ' '.join(resume_lems)
+    counts = _HASHER.transform([job_str, resume_str])
+    X = TfidfTransformer().fit_transform(counts)
+
+    job_set = set(job_lems)
+    expanded_job = job_set.copy()
+    for word in job_set:
         expanded_job.update(get_synonyms(word))
     matched = expanded_job.intersection(resume_lems)
-    return list(matched)
+    # Sorted so the order does not depend on the string hash seed
+    return sorted(matched), X
+
+def rank_matched_keywords_by_tfidf(matched_keywords, X):
+    """
+    Rank matched keywords by average TF-IDF score across the job description
+    and resume rows of the matrix returned by match_keywords_with_synonyms.
+    """
+    if not matched_keywords:
+        return []
+    # Hash the keywords into the same columns as X, then read their scores in one product
+    avg_scores = (X[0] + X[1]) / 2
+    scores = (_HASHER.transform(matched_keywords) @ avg_scores.T).toarray().ravel()
+    ranked = [(word, float(score)) for word, score in zip(matched_keywords, scores)]
+    # Ties are broken alphabetically so the ranking is stable across processes
+    ranked.sort(key=lambda x: (-x[1], x[0]))
+    return ranked
 
-def rank_matched_keywords_by_tfidf(matched_keywords, texts):
+def analyze_keywords(job_desc, resume_text):
     """
-    Rank matched keywords by average TF-IDF score.
+    Match and rank keywords with a single lemmatization and TF-IDF fit.
+    Returns a tuple of (matched_keywords, ranked_keywords).
     """
-    scores_list = compute_tfidf_scores(texts)
-    combined_scores = {}
-    for word in matched_keywords:
-        score_job = scores_list[0].get(word, 0)
-        score_resume = scores_list[1].get(word, 0)
-        avg_score = (score_job + score_resume) / 2
-        combined_scores[word] = avg_score
-    sorted_ranked = sorted(combined_scores.items(), key=lambda x: x[1], reverse=True)
-    return sorted_ranked
\ No newline at end of file
+    matched, X = match_keywords_with_synonyms(job_desc, resume_text)
+    return matched, rank_matched_keywords_by_tfidf(matched, X)
@@ -1,48 +1,184 @@
 # llm_client.py
 
 # import necessary libraries
+import functools
 import requests
 import json
 import re
 import shutil
+from collections import Counter
+from requests.adapters import HTTPAdapter
+from . import file_utils
 from .constants import STOPWORDS, MODEL_NAME, PROTECTED_KEYS
 
+# orjson is optional; it encodes and decodes faster than the stdlib json module.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Regex patterns compiled once at import
+_RE_TRAILING = re.compile(r',(\s*[}\]])')
+
+class _TokenTable(dict):
+    '''
+    str.translate table mapping every non-word character to a space, so keyword
+    text can be split with str.split into the same tokens as regex \\w+.
+    Word characters (alphanumerics and '_') map to themselves. Entries are
+    computed on first sight of each character and then reused.
+    '''
+    def __missing__(self, codepoint):
+        ch = chr(codepoint)
+        value = codepoint if ch.isalnum() or ch == '_' else ' '
+        self[codepoint] = value
+        return value
+
+_TOKEN_TABLE = _TokenTable()
+
+# Pooled HTTP session so repeat LLM calls reuse the connection to Ollama
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+def _json_loads(text):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+def _json_dumps(obj):
+    return orjson.dumps(obj).decode() if orjson is not None else json.dumps(obj)
+
 def separate_protected_sections(data):
     '''
     Separate protected sections from the main resume data.
     Returns a tuple of (non-protected, protected) dictionaries.
     Protected sections are defined by PROTECTED_KEYS.
     '''
-    protected = {k: data.get(k, []) for k in PROTECTED_KEYS}
+    protected = {k: data[k] for k in PROTECTED_KEYS if k in data}
     non_protected = {k: v for k, v in data.items() if k not in PROTECTED_KEYS}
     return non_protected, protected
 
+def _requote(text):
+    '''
+    Walk text once, yielding (piece, in_string) pairs with single-quoted
+    strings rewritten as double-quoted strings. in_string is True for string
+    contents and their quotes, so callers can act on structure characters only.
+    An unterminated string is closed at the end.
+    '''
+    quote = None  # quote character of the string being copied, if any
+    escape = False
+    for ch in text:
+        if quote:
+            if escape:
+                escape = False
+                # \' is not a valid JSON escape, but a bare ' is fine in "..."
+                yield (ch if ch == "'" else '\\' + ch), True
+            elif ch == '\\':
+                escape = True
+            elif ch == quote:
+                quote = None
+                yield '"', True
+            elif ch == '"':
+                yield '\\"', True
+            else:
+                yield ch, True
+        elif ch in '"\'':
+            quote = ch
+            yield '"', True
+        else:
+            yield ch, False
+    if quote:
+        yield '"', True
+
 def clean_json_like_text(text):
     '''
-    Clean LLM output to be valid JSON.
+    Clean LLM output to be valid JSON in a single pass.
     - Remove code block markers
-    - Convert single quotes to double quotes for keys
-    - Ensure string values are properly quoted
+    - Convert single-quoted keys and string values to double-quoted strings
+    - Leave apostrophes inside double-quoted strings untouched
     '''
-    text = re.sub(r'```json|```', '', text).strip()
-    text = re.sub(r"'(\w+)':", r'"\1":', text)
-    text = re.sub(r':\s*\'([^\']*)\'', r': "\1"', text)
-    return text
+    text = text.replace('```json', '').replace('```', '').strip()
+    return ''.join(piece for piece, _ in _requote(text))
+
+def _clean_json(text):
+    '''
+    Single left-to-right pass over LLM output that extracts the first JSON
+    object and repairs it as it goes:
+    - Skips code fence backticks and anything before the first '{'
+    - Rewrites single-quoted strings as double-quoted strings
+    - Drops trailing commas before } or ]
+    - Appends any closers missing from a truncated response
+    Returns the cleaned JSON text, or None if no object was found.
+    '''
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    out = []
+    closers = []
+    for piece, in_string in _requote(text[start:]):
+        if in_string:
+            out.append(piece)
+        elif piece in '{[':
+            closers.append('}' if piece == '{' else ']')
+            out.append(piece)
+        elif piece in '}]':
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ',':
+                out.pop()
+            if closers:
+                closers.pop()
+            out.append(piece)
+            if not closers:
+                break
+        elif piece != '`':
+            out.append(piece)
+
+    while out and (out[-1].isspace() or out[-1] == ','):
+        out.pop()
+    out.extend(reversed(closers))
+    return ''.join(out)
+
+def _first_json_span(text):
+    '''
+    Find the first top-level {...} object, skipping braces inside strings.
+    Returns the object text with strings requoted (or everything from its '{'
+    on, if it never closes), or None if there is no '{'.
+    '''
+    start = text.find('{')
+    if start == -1:
+        return None
+    out = []
+    depth = 0
+    for piece, in_string in _requote(text[start:]):
+        out.append(piece)
+        if in_string:
+            continue
+        if piece == '{':
+            depth += 1
+        elif piece == '}':
+            depth -= 1
+            if depth == 0:
+                break
+    return ''.join(out)
 
 def extract_json_from_text(text):
     """
     Extract and clean first JSON block from LLM response.
     Handles minor format issues like trailing commas.
     """
-    match = re.search(r'\{.*?\}', text, re.DOTALL)
-    if not match:
+    cleaned = _clean_json(text)
+    if cleaned is None:
         raise ValueError("No valid JSON object found in response.")
+    try:
+        return _json_loads(cleaned)
+    except json.JSONDecodeError:
+        pass  # Fall back to the regex-based cleanup below
 
-    json_block = match.group(0)
+    json_block = _first_json_span(text)
     cleaned_json = clean_json_like_text(json_block)
 
     # Fix trailing commas before closing } or ]
-    cleaned_json = re.sub(r',(\s*[}\]])', r'\1', cleaned_json)
+    cleaned_json = _RE_TRAILING.sub(r'\1', cleaned_json)
 
     # Optional: Ensure lists are properly closed (quick patch for common LLM cutoffs)
     open_brackets = cleaned_json.count('[')
@@ -56,10 +192,64 @@ def extract_json_from_text(text):
         cleaned_json += '}' * (open_braces - close_braces)
 
     try:
-        return json.loads(cleaned_json)
+        return _json_loads(cleaned_json)
     except json.JSONDecodeError as e:
         raise ValueError(f"JSON decoding failed after cleaning: {e}\nCleaned JSON: {cleaned_json}")
 
+def read_json_from_stream(response):
+    '''
+    Read a streamed Ollama response until the first complete top-level JSON
+    object has arrived, then close the connection.
+    Returns a tuple of (collected_text, parsed_json); parsed_json is None if
+    the collected text does not decode as strict JSON.
+    '''
+    collected = []
+    offset = 0  # characters collected before the current chunk
+    depth = 0
+    in_string = escape = False
+    obj_start = obj_end = None
+    try:
+        for line in response.iter_lines():
+            if not line:
+                continue
+            # Both orjson and json accept the raw bytes of each NDJSON line
+            decoded = _json_loads(line)
+            chunk = decoded.get("response", "")
+            collected.append(chunk)
+
+            # Track brace depth outside string literals across chunks
+            for i, ch in enumerate(chunk):
+                if in_string:
+                    if escape:
+                        escape = False
+                    elif ch == '\\':
+                        escape = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = True
+                elif ch == '{':
+                    if depth == 0:
+                        obj_start = offset + i
+                    depth += 1
+                elif ch == '}' and depth > 0:
+                    depth -= 1
+                    if depth == 0:
+                        obj_end = offset + i + 1
+                        break
+            offset += len(chunk)
+            if obj_end is not None or decoded.get("done"):
+                break
+    finally:
+        response.close()
+
+    full_text = ''.join(collected)
+    if obj_end is None:
+        return full_text, None
+    try:
+        return full_text, _json_loads(full_text[obj_start:obj_end])
+    except json.JSONDecodeError:
+        return full_text, None
 
 def extract_keywords(text, top_n=15):
     '''
@@ -67,13 +257,11 @@ def extract_keywords(text, top_n=15):
     Filters out common stopwords defined in constants.py.
     Returns a list of top N keywords.
     '''
-    words = re.findall(r'\b\w+\b', text.lower())
-    filtered = [w for w in words if w not in STOPWORDS and len(w) > 2]
-    freq = {}
-    for word in filtered:
-        freq[word] = freq.get(word, 0) + 1
-    sorted_keywords = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-    return [kw for kw, _ in sorted_keywords[:top_n]]
+    words = text.lower().translate(_TOKEN_TABLE).split()
+    # Two-letter words are kept for short keywords like "go", "ai" or "ui";
+    # the stopword list already removes the common ones
+    freq = Counter(w for w in words if len(w) > 1 and w not in STOPWORDS)
+    return [kw for kw, _ in freq.most_common(top_n)]
 
 def get_updated_resume_json(resume_core, job_desc, sections, ranked_keywords, skills_max_count=8):
     '''
@@ -86,9 +274,10 @@ def get_updated_resume_json(resume_core, job_desc, sections, ranked_keywords, sk
     # Incorporate the TF-IDF keywords into the prompt
     keywords_str = ', '.join([kw for kw, _ in ranked_keywords]) if ranked_keywords else ""
 
+    # Adjacent literals are joined at compile time, leaving a single f-string build
     prompt = (
         "You are an expert resume assistant specialized in ATS-optimized resumes.\n"
-        f"Resume data: {json.dumps(llm_input)}\n"
+        f"Resume data: {_json_dumps(llm_input)}\n"
         f"Job description: {job_desc}\n"
         f"Update sections: {', '.join(sections)}.\n"
         f"Focus on incorporating or improving emphasis on the following important skills and keywords: {keywords_str}.\n"
@@ -96,21 +285,17 @@ def get_updated_resume_json(resume_core, job_desc, sections, ranked_keywords, sk
         "Return ONLY a valid JSON object, no markdown, no comments, no explanations."
     )
 
-    response = requests.post(
+    response = _SESSION.post(
         'http://localhost:11434/api/generate',
         json={'model': MODEL_NAME, 'prompt': prompt},
         stream=True,
         timeout=180
     )
 
-    collected = []
-    for line in response.iter_lines():
-        if line:
-            decoded = json.loads(line.decode('utf-8') if isinstance(line, bytes) else line)
-            chunk = decoded.get("response", "")
-            collected.append(chunk)
-    full_text = ''.join(collected)
-    updated_json = extract_json_from_text(full_text)
+    full_text, updated_json = read_json_from_stream(response)
+    if updated_json is None:
+        # Fall back to the lenient cleanup for malformed output
+        updated_json = extract_json_from_text(full_text)
 
     # Post-process to enforce max skills
     if "skills" in updated_json and isinstance(updated_json["skills"], list):
@@ -118,9 +303,12 @@ def get_updated_resume_json(resume_core, job_desc, sections, ranked_keywords, sk
 
     return updated_json, full_text
 
+@functools.lru_cache(maxsize=1)
 def check_pandoc_engine():
     '''
-    Check if Pandoc is installed and can convert files.
-    Returns True if Pandoc is available, False otherwise.
+    Check if Pandoc and its pdflatex PDF engine are installed.
+    Pandoc is located the same way conversions find it (PATH or pypandoc's copy).
+    The result is cached since PATH lookups cannot change within a run.
+    Returns True if both are available, False otherwise.
     '''
-    return bool(shutil.which('pdflatex'))
+    return file_utils.PANDOC_PATH is not None and bool(shutil.which('pdflatex'))
@@ -1,8 +1,16 @@
 # _helpers/nltk_setup.py
 import nltk
 import os
+from nltk.corpus import wordnet
+
+# Set once all resources have been checked, so repeat calls skip the disk probes
+_NLTK_READY = False
 
 def ensure_nltk_resources():
+    global _NLTK_READY
+    if _NLTK_READY:
+        return
+
     venv_base = os.path.dirname(os.path.dirname(nltk.__file__))
     nltk_data_dir = os.path.join(venv_base, 'nltk_data')
 
@@ -21,6 +29,7 @@ def ensure_nltk_resources():
         'averaged_perceptron_tagger_eng'
     ]
 
+    ready = True
     for resource in resources:
         try:
             if resource == 'punkt':
@@ -32,6 +41,19 @@ def ensure_nltk_resources():
             print(f"NLTK resource '{resource}' already installed in venv.")
         except LookupError:
             print(f"Downloading NLTK resource '{resource}' to {nltk_data_dir}...")
-            nltk.download(resource, download_dir=nltk_data_dir)
+            if not nltk.download(resource, download_dir=nltk_data_dir):
+                print(f"NLTK resource '{resource}' could not be downloaded.")
+                ready = False
+
+    # One lookup loads the WordNet reader and its lemma index, so the first
+    # request does not pay for it; individual synonyms are cached by get_synonyms
+    try:
+        wordnet.synsets('test')
+    except LookupError:
+        print("WordNet could not be loaded.")
+        ready = False
 
+    if not ready:
+        return
+    _NLTK_READY = True
     print("All required NLTK resources are ready.")
@@ -1,35 +1,57 @@
 # styler.py
 
 # import necessary libraries
+import functools
 import json
+import os
 from docx import Document
 from docx.shared import Pt, RGBColor
 
+@functools.lru_cache(maxsize=8)
+def _load_styles(json_path, mtime):
+    '''
+    Load the style configuration and convert it to python-docx font values once.
+    The file's modification time is part of the cache key so edits are picked up.
+    Returns a dict mapping style names to {font attribute: value}.
+    '''
+    with open(json_path, 'r') as f:
+        styles_config = json.load(f)
+
+    font_styles = {}
+    for style_name, props in styles_config.items():
+        values = {}
+        if 'font' in props:
+            values['name'] = props['font']
+        if 'size' in props:
+            values['size'] = Pt(props['size'])
+        if 'color' in props:
+            values['color'] = RGBColor.from_string(props['color'])
+        if 'bold' in props:
+            values['bold'] = props['bold']
+        if 'italic' in props:
+            values['italic'] = props['italic']
+        font_styles[style_name] = values
+    return font_styles
+
 def apply_styles_to_docx(docx_path, json_path, output_path):
     '''
     Apply styles to a DOCX file based on a JSON configuration.
     The JSON should contain style definitions for the document.
     '''
     doc = Document(docx_path)
-    with open(json_path, 'r') as f:
-        styles_config = json.load(f)
+    font_styles = _load_styles(json_path, os.path.getmtime(json_path))
 
-    for style_name, props in styles_config.items():
-        try:
-            style = doc.styles[style_name]
-            font = style.font
-            if 'font' in props:
-                font.name = props['font']
-            if 'size' in props:
-                font.size = Pt(props['size'])
-            if 'color' in props:
-                font.color.rgb = RGBColor.from_string(props['color'])
-            if 'bold' in props:
-                font.bold = props['bold']
-            if 'italic' in props:
-                font.italic = props['italic']
-        except KeyError:
+    available = {style.name for style in doc.styles}
+    for style_name, values in font_styles.items():
+        if style_name not in available:
             print(f"Warning: Style '{style_name}' not found in document.")
+            continue
+        font = doc.styles[style_name].font
+        for attr, value in values.items():
+            if attr == 'color':
+                font.color.rgb = value
+            else:
+                setattr(font, attr, value)
 
     doc.save(output_path)
     print(f"Styled DOCX saved to {output_path}")
@@ -18,25 +18,57 @@ Files included:
 '''
 
 import streamlit as st
-import json
 import os
+from pathlib import Path
 
 from _helpers.llm_client import get_updated_resume_json, check_pandoc_engine
-from _helpers.file_utils import load_json, save_file, convert_to_pdf, convert_to_docx, apply_docx_styles, generate_diff
+from _helpers.file_utils import load_json, save_file, iter_strings, convert_to_pdf_and_docx, apply_docx_styles, generate_diff, safe_name_part
 from _helpers.constants import PROTECTED_KEYS
-from _helpers.lemmatize import match_keywords_with_synonyms, rank_matched_keywords_by_tfidf
+from _helpers.lemmatize import analyze_keywords
 from _helpers.nltk_setup import ensure_nltk_resources
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 
 @st.cache_resource
 def setup_nltk_once():
     ensure_nltk_resources()
+    return True
 
 setup_nltk_once()
 
-# Ensure folders
-os.makedirs('resumes', exist_ok=True)
-os.makedirs('output', exist_ok=True)
+# File modification time is part of the cache key so edited files are reloaded
+@st.cache_data(show_spinner=False)
+def load_json_cached(path, mtime):
+    return load_json(path)
+
+@st.cache_data(show_spinner=False)
+def resume_as_text(path, mtime):
+    # Only the resume's string values are analyzed; JSON keys and syntax would add noise
+    return ' '.join(iter_strings(load_json_cached(path, mtime)))
+
+# Identical inputs reuse the previous LLM output instead of paying for inference again.
+# Results stay in memory only and expire after an hour; the sidebar
+# "Clear cached LLM results" button forces a fresh generation sooner.
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=32)
+def generate_updated_resume(resume_core, job_desc, sections, ranked_keywords):
+    return get_updated_resume_json(resume_core, job_desc, list(sections), ranked_keywords)
+
+@st.cache_resource
+def get_resume_template():
+    # Compiled template bytecode is kept in the system temp dir to speed up cold starts
+    env = Environment(loader=FileSystemLoader('.'), bytecode_cache=FileSystemBytecodeCache())
+    return env.get_template('resume_template.md')
+
+# Maximum characters of the raw LLM response shown in the debug view
+MAX_DEBUG_CHARS = 4000
+
+# Ensure folders (once per process, not on every rerun)
+@st.cache_resource
+def ensure_folders_once():
+    os.makedirs('resumes', exist_ok=True)
+    os.makedirs('output', exist_ok=True)
+    return True
+
+ensure_folders_once()
 
 # Streamlit setup
 st.set_page_config(page_title="Resume Tailoring App", layout="wide")
@@ -52,6 +84,11 @@ organization = st.text_input("Organization Name", value="")
 job_title = st.text_input("Job Title", value="")
 job_desc = st.text_area("Paste Job Description", height=300, value="")
 
+st.sidebar.checkbox("Show LLM debug output", key='debug_llm')
+if st.sidebar.button("Clear cached LLM results"):
+    generate_updated_resume.clear()
+    st.sidebar.success("Cached LLM results cleared.")
+
 sections_to_update = st.multiselect(
     "Select sections to rewrite",
     ["summary", "skills", "experience", "projects", "technical-tools", "strengths"],
@@ -67,14 +104,14 @@ if st.button("Generate Updated Resume"):
     with st.spinner("Loading resume and personal info..."):
         resume_file = f"resumes/{focus_area.lower().replace(' ', '_')}_resume.json"
         personal_file = "personal_info.json"
-        resume_core = load_json(resume_file)
-        personal_info = load_json(personal_file)
+        resume_mtime = os.path.getmtime(resume_file)
+        resume_core = load_json_cached(resume_file, resume_mtime)
+        personal_info = load_json_cached(personal_file, os.path.getmtime(personal_file))
 
     # Analyze keywords
     with st.spinner("Analyzing job description and resume for keywords..."):
-        resume_text = json.dumps(resume_core)
-        matched_keywords = match_keywords_with_synonyms(job_desc, resume_text)
-        ranked_keywords = rank_matched_keywords_by_tfidf(matched_keywords, [job_desc, resume_text])
+        resume_text = resume_as_text(resume_file, resume_mtime)
+        matched_keywords, ranked_keywords = analyze_keywords(job_desc, resume_text)
 
     st.markdown("### Enhanced Keyword Match Check")
     if matched_keywords:
@@ -82,19 +119,24 @@ if st.button("Generate Updated Resume"):
     else:
         st.write("**Matched (lemmatized + synonyms): None**")
 
-    # Call LLM
-    with st.spinner("Calling LLM to generate updated resume..."):
-        updated_json, raw_response = get_updated_resume_json(
-            resume_core, job_desc, sections_to_update, ranked_keywords
-        )
-
-    # Debug output
-    st.markdown("### Raw LLM Response")
-    st.code(raw_response)
-    st.markdown("### LLM JSON Keys Returned")
-    st.code(list(updated_json.keys()))
-    st.markdown("### LLM JSON Output")
-    st.json(updated_json)
+    # Call LLM (skipped when there is nothing to rewrite)
+    if sections_to_update:
+        with st.spinner("Calling LLM to generate updated resume..."):
+            updated_json, raw_response = generate_updated_resume(
+                resume_core, job_desc, tuple(sections_to_update), ranked_keywords
+            )
+    else:
+        updated_json, raw_response = {}, "No sections selected; LLM call skipped."
+
+    # Debug output (only sent to the browser when enabled in the sidebar)
+    if st.session_state.get('debug_llm'):
+        with st.expander("Debug: LLM response", expanded=False):
+            st.markdown("### Raw LLM Response")
+            st.code(raw_response[:MAX_DEBUG_CHARS])
+            st.markdown("### LLM JSON Keys Returned")
+            st.code(list(updated_json.keys()))
+            st.markdown("### LLM JSON Output")
+            st.json(updated_json)
 
     # Compare summary
     st.markdown("### Original vs Updated Summary")
@@ -107,10 +149,10 @@ if st.button("Generate Updated Resume"):
     # Merge all data
     final_resume = {**resume_core, **updated_json, **personal_info}
 
-    first_name = personal_info.get('name', 'First Last').split()[0]
-    last_name = personal_info.get('name', 'First Last').split()[-1]
-    safe_org = organization.replace(' ', '_')
-    safe_job = job_title.replace(' ', '_')
+    name_parts = personal_info.get('name', 'First Last').split() or ['First', 'Last']
+    first_name, last_name = name_parts[0], name_parts[-1]
+    safe_org = safe_name_part(organization)
+    safe_job = safe_name_part(job_title)
     safe_focus = focus_area.replace(' ', '')
     safe_name = f"{first_name}_{last_name}_{safe_focus}_{safe_job}"
     org_folder = os.path.join('output', safe_org)
@@ -123,18 +165,19 @@ if st.button("Generate Updated Resume"):
     st.code(diff_summary or "No changes.")
 
     with st.spinner("Rendering resume as Markdown..."):
-        env = Environment(loader=FileSystemLoader('.'))
-        template = env.get_template('resume_template.md')
-        rendered_md = template.render(final_resume)
+        rendered_md = get_resume_template().render(final_resume)
         md_path = os.path.join(org_folder, f"{safe_name}.md")
         save_file(md_path, rendered_md)
 
     # Convert to PDF and DOCX
     pdf_path, docx_path, styled_docx_path = None, None, None
+    pdf_available = check_pandoc_engine()
+    if not pdf_available:
+        st.warning("Pandoc or pdflatex was not found; skipping PDF output.")
     with st.spinner("Converting to PDF and DOCX..."):
-        if check_pandoc_engine():
-            pdf_path = convert_to_pdf(md_path, org_folder, safe_name)
-        docx_path = convert_to_docx(md_path, org_folder, safe_name)
+        pdf_path, docx_path = convert_to_pdf_and_docx(
+            md_path, org_folder, safe_name, include_pdf=pdf_available, md_text=rendered_md
+        )
 
     with st.spinner("Applying styles to DOCX..."):
         styled_docx_path = apply_docx_styles(docx_path, 'styles.json', org_folder, safe_name)
@@ -142,10 +185,8 @@ if st.button("Generate Updated Resume"):
     # Download buttons
     st.success(f"Files saved to `{org_folder}`")
     if pdf_path and os.path.exists(pdf_path):
-        with open(pdf_path, 'rb') as f:
-            st.download_button("Download PDF", f, file_name=f"{safe_name}.pdf")
+        st.download_button("Download PDF", Path(pdf_path).read_bytes(), file_name=f"{safe_name}.pdf")
     if styled_docx_path and os.path.exists(styled_docx_path):
-        with open(styled_docx_path, 'rb') as f:
-            st.download_button("Download Styled DOCX", f, file_name=f"{safe_name}_styled.docx")
+        st.download_button("Download Styled DOCX", Path(styled_docx_path).read_bytes(), file_name=f"{safe_name}_styled.docx")
 
     st.markdown("---")
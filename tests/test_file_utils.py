@@ -0,0 +1,19 @@
+# tests/test_file_utils.py
+
+from _helpers.file_utils import safe_name_part
+
+
+def test_safe_name_part_replaces_separators():
+    assert safe_name_part("Acme Corp/Labs\\EU") == "Acme_Corp_Labs_EU"
+
+
+def test_safe_name_part_rejects_dot_segments():
+    assert safe_name_part("..") == "resume"
+    assert safe_name_part(".") == "resume"
+    assert safe_name_part("../..") == "_"
+    assert safe_name_part("") == "resume"
+
+
+def test_safe_name_part_strips_surrounding_dots():
+    assert safe_name_part(".hidden.") == "hidden"
+    assert safe_name_part("v1.2") == "v1.2"
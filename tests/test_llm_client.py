@@ -0,0 +1,16 @@
+# tests/test_llm_client.py
+
+from _helpers.llm_client import extract_keywords
+
+
+def test_extract_keywords_keeps_domain_terms_from_sklearn_stopwords():
+    keywords = extract_keywords("Go developer for distributed system design; Go and system tooling.")
+    assert 'go' in keywords
+    assert 'system' in keywords
+
+
+def test_extract_keywords_drops_common_stopwords():
+    keywords = extract_keywords("The team will build the platform with the team")
+    assert 'the' not in keywords
+    assert 'will' not in keywords
+    assert keywords[0] == 'team'